@@ -34,8 +34,12 @@ class Card:
     ord: int
 
     def __init__(
-        self, col: anki.collection.Collection, id: Optional[int] = None
+        self,
+        col: anki.collection.Collection,
+        id: Optional[int] = None,
+        backend_card: Optional[BackendCard] = None,
     ) -> None:
+        assert not (id and backend_card)
         self.col = col.weakref()
         self.timerStarted = None
         self._render_output: Optional[anki.template.TemplateRenderOutput] = None
@@ -43,6 +47,9 @@ class Card:
             # existing card
             self.id = id
             self.load()
+        elif backend_card is not None:
+            # existing card already fetched from the backend
+            self._load_from_backend_card(backend_card)
         else:
             # new card with defaults
             self._load_from_backend_card(BackendCard())
@@ -10,7 +10,18 @@ import re
 import time
 import traceback
 import weakref
-from typing import Any, Iterable, List, Optional, Sequence, Tuple, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import anki.find
 import anki.latex  # sets up hook
@@ -30,7 +41,7 @@ from anki.rsbackend import TR, DBError, FormatTimeSpanContext, RustBackend, pb
 from anki.sched import Scheduler as V1Scheduler
 from anki.schedv2 import Scheduler as V2Scheduler
 from anki.tags import TagManager
-from anki.utils import devMode, ids2str, intTime
+from anki.utils import devMode, firstField, ids2str, intTime, stripHTMLMedia
 
 
 class Collection:
@@ -282,6 +293,13 @@ class Collection:
     def getNote(self, id: int) -> Note:
         return Note(self, id=id)
 
+    def get_cards_by_nid(self, nid: int) -> List[Card]:
+        "All cards of a note in ord order, fetched with a single backend call."
+        return [
+            Card(self, backend_card=backend_card)
+            for backend_card in self.backend.get_cards_for_note(nid)
+        ]
+
     # Utils
     ##########################################################################
 
@@ -337,6 +355,43 @@ class Collection:
         self._logRem(ids, REM_NOTE)
         self.db.execute("delete from notes where id in %s" % strids)
 
+    def find_dupes_bulk(self, notes: List[Note]) -> List[int]:
+        """Check the first field of each note for emptiness or duplicates.
+
+        Returns a list parallel to NOTES, with the same values as
+        Note.dupeOrEmpty(): 1 if empty, 2 if a duplicate, 0 otherwise.
+        Only one query is made per notetype, instead of one per note."""
+        results = [0] * len(notes)
+        # mid -> stripped first field -> indices into notes
+        wanted: Dict[int, Dict[str, List[int]]] = {}
+        csums: Dict[int, Set[int]] = {}
+        for idx, note in enumerate(notes):
+            val = note.fields[0]
+            if not val.strip():
+                results[idx] = 1
+                continue
+            stripped, csum = note._stripped_first_field()
+            wanted.setdefault(note.mid, {}).setdefault(stripped, []).append(idx)
+            csums.setdefault(note.mid, set()).add(csum)
+
+        # identical first fields are common in existing rows, so avoid
+        # stripping the same text more than once
+        stripped_cache: Dict[str, str] = {}
+        for mid, by_stripped in wanted.items():
+            for nid, flds in self.db.all(
+                "select id, flds from notes where mid = ? and csum in "
+                + ids2str(csums[mid]),
+                mid,
+            ):
+                first = firstField(flds)
+                stripped = stripped_cache.get(first)
+                if stripped is None:
+                    stripped = stripped_cache[first] = stripHTMLMedia(first)
+                for idx in by_stripped.get(stripped, ()):
+                    if notes[idx].id != nid:
+                        results[idx] = 2
+        return results
+
     # Cards
     ##########################################################################
 
@@ -427,6 +482,15 @@ select id from notes where id in %s and id not in (select nid from cards)"""
     def find_notes(self, query: str) -> Sequence[int]:
         return self.backend.search_notes(query)
 
+    def iter_notes(self, query: str, batch_size: int = 1024) -> Iterator[Note]:
+        "Yield notes matching QUERY, fetching them from the backend in batches."
+        nids = self.find_notes(query)
+        for start in range(0, len(nids), batch_size):
+            for backend_note in self.backend.get_notes(
+                nids[start : start + batch_size]
+            ):
+                yield Note(self, backend_note=backend_note)
+
     def find_and_replace(
         self,
         nids: List[int],
@@ -2,15 +2,16 @@
 # License: GNU AGPL, version 3 or later; http://www.gnu.org/licenses/agpl.html
 
 import html
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 from anki.collection import Collection
 from anki.consts import NEW_CARDS_RANDOM, STARTING_FACTOR
 from anki.importing.base import Importer
 from anki.lang import _, ngettext
 from anki.utils import (
-    fieldChecksum,
+    fieldChecksums,
     guid64,
+    ids2str,
     intTime,
     joinFields,
     splitFields,
@@ -120,7 +121,7 @@ class NoteImporter(Importer):
             if f == "_tags":
                 self._tagsMapped = True
         # gather checks for duplicate comparison
-        csums: Dict[str, List[int]] = {}
+        csums: Dict[int, List[int]] = {}
         for csum, id in self.col.db.execute(
             "select csum, id from notes where mid = ?", self.model["id"]
         ):
@@ -149,8 +150,19 @@ class NoteImporter(Importer):
                 n.fields[c] = n.fields[c].strip()
                 if not self.allowHTML:
                     n.fields[c] = n.fields[c].replace("\n", "<br>")
+        fld0csums = fieldChecksums(n.fields[fld0idx] for n in notes)
+        # fetch any existing notes with a matching csum up front, instead
+        # of querying for each one as it's encountered
+        candidates: Set[int] = set()
+        for csum in fld0csums:
+            candidates.update(csums.get(csum, ()))
+        existing: Dict[int, str] = dict(
+            self.col.db.execute(
+                "select id, flds from notes where id in " + ids2str(candidates)
+            )
+        )
+        for n, csum in zip(notes, fld0csums):
             fld0 = n.fields[fld0idx]
-            csum = fieldChecksum(fld0)
             # first field must exist
             if not fld0:
                 self.log.append(_("Empty first field: %s") % " ".join(n.fields))
@@ -166,8 +178,7 @@ class NoteImporter(Importer):
             if csum in csums:
                 # csum is not a guarantee; have to check
                 for id in csums[csum]:
-                    flds = self.col.db.scalar("select flds from notes where id = ?", id)
-                    sflds = splitFields(flds)
+                    sflds = splitFields(existing[id])
                     if fld0 == sflds[0]:
                         # duplicate
                         found = True
@@ -65,6 +65,8 @@ class ModelManager:
         self.models = ModelsDictProxy(col)
         # do not access this directly!
         self._cache = {}
+        self._field_pairs_cache: Dict[int, List[Tuple[int, str]]] = {}
+        self._field_ord_cache: Dict[int, Dict[str, int]] = {}
 
     def save(
         self,
@@ -95,16 +97,22 @@ class ModelManager:
 
     def _update_cache(self, nt: NoteType) -> None:
         self._cache[nt["id"]] = nt
+        self._field_pairs_cache.pop(nt["id"], None)
+        self._field_ord_cache.pop(nt["id"], None)
 
     def _remove_from_cache(self, ntid: int) -> None:
         if ntid in self._cache:
             del self._cache[ntid]
+        self._field_pairs_cache.pop(ntid, None)
+        self._field_ord_cache.pop(ntid, None)
 
     def _get_cached(self, ntid: int) -> Optional[NoteType]:
         return self._cache.get(ntid)
 
     def _clear_cache(self):
         self._cache = {}
+        self._field_pairs_cache = {}
+        self._field_ord_cache = {}
 
     # Listing note types
     #############################################################
@@ -266,6 +274,24 @@ class ModelManager:
         "Mapping of field name -> (ord, field)."
         return dict((f["name"], (f["ord"], f)) for f in m["flds"])
 
+    def sorted_field_pairs(self, ntid: int) -> List[Tuple[int, str]]:
+        "(ord, name) of each field, in field order. Do not modify the result."
+        pairs = self._field_pairs_cache.get(ntid)
+        if pairs is None:
+            nt = self.get(ntid)
+            pairs = sorted((f["ord"], f["name"]) for f in nt["flds"])
+            self._field_pairs_cache[ntid] = pairs
+        return pairs
+
+    def field_ord_map(self, ntid: int) -> Dict[str, int]:
+        "Mapping of field name -> ord. Do not modify the result."
+        ords = self._field_ord_cache.get(ntid)
+        if ords is None:
+            nt = self.get(ntid)
+            ords = {f["name"]: f["ord"] for f in nt["flds"]}
+            self._field_ord_cache[ntid] = ords
+        return ords
+
     def fieldNames(self, m: NoteType) -> List[str]:
         return [f["name"] for f in m["flds"]]
 
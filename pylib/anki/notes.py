@@ -9,28 +9,48 @@ import anki  # pylint: disable=unused-import
 from anki import hooks
 from anki.models import NoteType
 from anki.rsbackend import BackendNote
-from anki.utils import fieldChecksum, joinFields, splitFields, stripHTMLMedia
+from anki.utils import joinFields, stripHTMLMedia, strippedFieldChecksum
 
 
 class Note:
-    # not currently exposed
-    flags = 0
-    data = ""
+    __slots__ = (
+        "col",
+        "id",
+        "guid",
+        "mid",
+        "mod",
+        "usn",
+        "tags",
+        "fields",
+        "flags",
+        "data",
+        "_ord_map",
+        "_field_pairs",
+        "_fld0_seen",
+        "_fld0_stripped",
+        "_fld0_csum",
+    )
 
     def __init__(
         self,
         col: anki.collection.Collection,
         model: Optional[NoteType] = None,
         id: Optional[int] = None,
+        backend_note: Optional[BackendNote] = None,
     ) -> None:
-        assert not (model and id)
+        assert sum(x is not None for x in (model, id, backend_note)) <= 1
         self.col = col.weakref()
-        # self.newlyAdded = False
+        # not currently exposed
+        self.flags = 0
+        self.data = ""
 
         if id:
             # existing note
             self.id = id
             self.load()
+        elif backend_note is not None:
+            # existing note already fetched from the backend
+            self._load_from_backend_note(backend_note)
         else:
             # new note for provided notetype
             self._load_from_backend_note(self.col.backend.new_note(model["id"]))
@@ -46,9 +66,14 @@ class Note:
         self.mid = n.ntid
         self.mod = n.mtime_secs
         self.usn = n.usn
+        # the backend returns protobuf containers, not lists
         self.tags = list(n.tags)
         self.fields = list(n.fields)
-        self._fmap = self.col.models.fieldMap(self.model())
+        self._ord_map = self.col.models.field_ord_map(self.mid)
+        self._field_pairs = self.col.models.sorted_field_pairs(self.mid)
+        self._fld0_seen: Optional[str] = None
+        self._fld0_stripped = ""
+        self._fld0_csum = 0
 
     def to_backend_note(self) -> BackendNote:
         hooks.note_will_flush(self)
@@ -70,18 +95,13 @@ class Note:
         return joinFields(self.fields)
 
     def cards(self) -> List[anki.cards.Card]:
-        return [
-            self.col.getCard(id)
-            for id in self.col.db.list(
-                "select id from cards where nid = ? order by ord", self.id
-            )
-        ]
+        return self.col.get_cards_by_nid(self.id)
 
     def model(self) -> Optional[NoteType]:
+        # the model manager already caches notetypes, and keeping a copy
+        # here could return one that has since been replaced
         return self.col.models.get(self.mid)
 
-    _model = property(model)
-
     def cloze_numbers_in_fields(self) -> Sequence[int]:
         return self.col.backend.cloze_numbers_in_note(self.to_backend_note())
 
@@ -89,28 +109,25 @@ class Note:
     ##################################################
 
     def keys(self) -> List[str]:
-        return list(self._fmap.keys())
+        return list(self._ord_map.keys())
 
     def values(self) -> List[str]:
         return self.fields
 
     def items(self) -> List[Tuple[Any, Any]]:
-        return [(f["name"], self.fields[ord]) for ord, f in sorted(self._fmap.values())]
+        return [(name, self.fields[ord]) for ord, name in self._field_pairs]
 
-    def _fieldOrd(self, key: str) -> Any:
-        try:
-            return self._fmap[key][0]
-        except:
-            raise KeyError(key)
+    def _fieldOrd(self, key: str) -> int:
+        return self._ord_map[key]
 
     def __getitem__(self, key: str) -> str:
-        return self.fields[self._fieldOrd(key)]
+        return self.fields[self._ord_map[key]]
 
     def __setitem__(self, key: str, value: str) -> None:
-        self.fields[self._fieldOrd(key)] = value
+        self.fields[self._ord_map[key]] = value
 
     def __contains__(self, key) -> bool:
-        return key in self._fmap
+        return key in self._ord_map
 
     # Tags
     ##################################################
@@ -125,12 +142,8 @@ class Note:
         self.tags = self.col.tags.split(tags)
 
     def delTag(self, tag: str) -> None:
-        rem = []
-        for t in self.tags:
-            if t.lower() == tag.lower():
-                rem.append(t)
-        for r in rem:
-            self.tags.remove(r)
+        target = tag.casefold()
+        self.tags = [t for t in self.tags if t.casefold() != target]
 
     def addTag(self, tag: str) -> None:
         # duplicates will be stripped on save
@@ -139,19 +152,19 @@ class Note:
     # Unique/duplicate check
     ##################################################
 
+    def _stripped_first_field(self) -> Tuple[str, int]:
+        "First field with HTML stripped, and its checksum."
+        val = self.fields[0]
+        # any change to the field replaces the string object, so an
+        # identity check is enough to tell if the cache is stale
+        if self._fld0_seen is not val:
+            stripped = stripHTMLMedia(val)
+            self._fld0_csum = strippedFieldChecksum(stripped)
+            self._fld0_stripped = stripped
+            self._fld0_seen = val
+        return self._fld0_stripped, self._fld0_csum
+
     def dupeOrEmpty(self) -> int:
         "1 if first is empty; 2 if first is a duplicate, False otherwise."
-        val = self.fields[0]
-        if not val.strip():
-            return 1
-        csum = fieldChecksum(val)
-        # find any matching csums and compare
-        for flds in self.col.db.list(
-            "select flds from notes where csum = ? and id != ? and mid = ?",
-            csum,
-            self.id or 0,
-            self.mid,
-        ):
-            if stripHTMLMedia(splitFields(flds)[0]) == stripHTMLMedia(self.fields[0]):
-                return 2
-        return False
+        # when checking many notes, use col.find_dupes_bulk() instead
+        return self.col.find_dupes_bulk([self])[0] or False
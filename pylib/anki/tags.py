@@ -155,4 +155,5 @@ class TagManager:
 
     def inList(self, tag: str, tags: List[str]) -> bool:
         "True if TAG is in TAGS. Ignore case."
-        return tag.lower() in [t.lower() for t in tags]
+        target = tag.casefold()
+        return any(t.casefold() == target for t in tags)
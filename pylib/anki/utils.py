@@ -62,6 +62,9 @@ reMedia = re.compile("(?i)<img[^>]+src=[\"']?([^\"'>]+)[\"']?[^>]*>")
 
 
 def stripHTML(s: str) -> str:
+    if "<" not in s and "&" not in s:
+        # plain text; nothing for the expressions below to match
+        return s
     s = reComment.sub("", s)
     s = reStyle.sub("", s)
     s = reScript.sub("", s)
@@ -213,6 +216,11 @@ def splitFields(string: str) -> List[str]:
     return string.split("\x1f")
 
 
+def firstField(string: str) -> str:
+    "Same as splitFields(string)[0], without splitting the other fields."
+    return string.partition("\x1f")[0]
+
+
 # Checksums
 ##############################################################################
 
@@ -223,9 +231,20 @@ def checksum(data: Union[bytes, str]) -> str:
     return sha1(data).hexdigest()
 
 
+def strippedFieldChecksum(stripped: str) -> int:
+    "fieldChecksum() of text that has already been through stripHTMLMedia()."
+    # 32 bit unsigned number from first 8 digits of sha1 hash; the backend
+    # computes the same value for notes.csum
+    return int.from_bytes(sha1(stripped.encode("utf-8")).digest()[:4], "big")
+
+
 def fieldChecksum(data: str) -> int:
-    # 32 bit unsigned number from first 8 digits of sha1 hash
-    return int(checksum(stripHTMLMedia(data).encode("utf-8"))[:8], 16)
+    return strippedFieldChecksum(stripHTMLMedia(data))
+
+
+def fieldChecksums(fields: Iterable[str]) -> List[int]:
+    "fieldChecksum() of each of the provided fields."
+    return [strippedFieldChecksum(stripHTMLMedia(f)) for f in fields]
 
 
 # Temp files
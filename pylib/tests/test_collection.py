@@ -81,6 +81,10 @@ def test_noteAddDelete():
     # empty first field should not be permitted either
     f2["Front"] = " "
     assert f2.dupeOrEmpty()
+    # checking in bulk should match the individual checks
+    f3 = deck.newNote()
+    f3["Front"] = "<b>three</b>"
+    assert deck.find_dupes_bulk([f, f2, f3]) == [0, 1, 2]
 
 
 def test_fieldChecksum():
@@ -96,6 +100,17 @@ def test_fieldChecksum():
     assert deck.db.scalar("select csum from notes") == int("302811ae", 16)
 
 
+def test_iter_notes():
+    deck = getEmptyCol()
+    for txt in "one", "two", "three":
+        f = deck.newNote()
+        f["Front"] = txt
+        deck.addNote(f)
+    notes = list(deck.iter_notes("", batch_size=2))
+    assert sorted(n["Front"] for n in notes) == ["one", "three", "two"]
+    assert notes[0].fields == deck.getNote(notes[0].id).fields
+
+
 def test_addDelTags():
     deck = getEmptyCol()
     f = deck.newNote()
@@ -115,6 +130,11 @@ def test_addDelTags():
     f.load()
     assert f.tags[0] == "aaa"
     assert len(f.tags) == 2
+    # removing ignores case
+    assert f.hasTag("FOO")
+    f.delTag("FOO")
+    assert f.tags == ["aaa"]
+    assert not f.hasTag("foo")
 
 
 def test_timestamps():
@@ -39,6 +39,11 @@ def test_fields():
     f["Back"] = "2"
     d.addNote(f)
     m = d.models.current()
+    # a loaded note keeps the fields it was loaded with
+    d.models.addField(m, d.models.newField("extra"))
+    assert f.keys() == ["Front", "Back"]
+    assert f.items() == [("Front", "1"), ("Back", "2")]
+    d.models.remField(m, m["flds"][2])
     # make sure renaming a field updates the templates
     d.models.renameField(m, m["flds"][0], "NewFront")
     assert "{{NewFront}}" in m["tmpls"][0]["qfmt"]
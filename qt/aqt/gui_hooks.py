@@ -1475,6 +1475,37 @@ class _EmptyCardsWillShowHook:
 empty_cards_will_show = _EmptyCardsWillShowHook()
 
 
+class _MediaSyncDidLogEntriesHook:
+    """Called once with each batch of new log entries, after
+        media_sync_did_progress has been called for each of them."""
+
+    _hooks: List[Callable[["List[aqt.mediasync.LogEntryWithTime]"], None]] = []
+
+    def append(
+        self, cb: Callable[["List[aqt.mediasync.LogEntryWithTime]"], None]
+    ) -> None:
+        """(entries: List[aqt.mediasync.LogEntryWithTime])"""
+        self._hooks.append(cb)
+
+    def remove(
+        self, cb: Callable[["List[aqt.mediasync.LogEntryWithTime]"], None]
+    ) -> None:
+        if cb in self._hooks:
+            self._hooks.remove(cb)
+
+    def __call__(self, entries: List[aqt.mediasync.LogEntryWithTime]) -> None:
+        for hook in self._hooks:
+            try:
+                hook(entries)
+            except:
+                # if the hook fails, remove it
+                self._hooks.remove(hook)
+                raise
+
+
+media_sync_did_log_entries = _MediaSyncDidLogEntriesHook()
+
+
 class _MediaSyncDidProgressHook:
     _hooks: List[Callable[["aqt.mediasync.LogEntryWithTime"], None]] = []
 
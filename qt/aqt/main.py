@@ -1426,14 +1426,18 @@ will be lost. Continue?"""
         print("Back:", card.answer())
 
         print("\nNote:")
-        note = copy.copy(card.note())
+        note = card.note()
         for k, v in note.items():
             print(f"- {k}:", v)
 
         print("\n")
-        del note.fields
-        del note._fmap
-        pprint.pprint(note.__dict__)
+        pprint.pprint(
+            {
+                k: getattr(note, k)
+                for k in note.__slots__
+                if not k.startswith("_") and k != "fields"
+            }
+        )
 
         print("\nCard:")
         c = copy.copy(card)
@@ -4,9 +4,11 @@
 from __future__ import annotations
 
 import time
+from collections import deque
 from concurrent.futures import Future
 from dataclasses import dataclass
-from typing import List, Union
+from threading import Lock
+from typing import Deque, List, Union
 
 import aqt
 from anki import hooks
@@ -28,8 +30,11 @@ from aqt.utils import showWarning, tr
 LogEntry = Union[MediaSyncProgress, str]
 
 
-@dataclass
+@dataclass(frozen=True)
 class LogEntryWithTime:
+    # dataclass(slots=True) requires Python 3.10
+    __slots__ = ("time", "entry")
+
     time: int
     entry: LogEntry
 
@@ -38,7 +43,13 @@ class MediaSyncer:
     def __init__(self, mw: aqt.main.AnkiQt):
         self.mw = mw
         self._syncing: bool = False
-        self._log: List[LogEntryWithTime] = []
+        # only the most recent entries are kept, so the log does not grow
+        # for as long as the app is left running
+        self._log: Deque[LogEntryWithTime] = deque(maxlen=5000)
+        # entries not yet passed to the main thread
+        self._pending: List[LogEntryWithTime] = []
+        self._pending_lock = Lock()
+        self._flush_scheduled = False
         self._want_stop = False
         hooks.bg_thread_progress_callback.append(self._on_rust_progress)
         gui_hooks.media_sync_did_start_or_stop.append(self._on_start_stop)
@@ -88,10 +99,25 @@ class MediaSyncer:
 
     def _log_and_notify(self, entry: LogEntry) -> None:
         entry_with_time = LogEntryWithTime(time=intTime(), entry=entry)
-        self._log.append(entry_with_time)
-        self.mw.taskman.run_on_main(
-            lambda: gui_hooks.media_sync_did_progress(entry_with_time)
-        )
+        with self._pending_lock:
+            self._pending.append(entry_with_time)
+            if self._flush_scheduled:
+                # entries that arrive before the flush runs share its dispatch
+                return
+            self._flush_scheduled = True
+        self.mw.taskman.run_on_main(self._flush_pending)
+
+    def _flush_pending(self) -> None:
+        "Log and notify about pending entries. This runs in the main thread."
+        with self._pending_lock:
+            entries = self._pending
+            self._pending = []
+            self._flush_scheduled = False
+
+        self._log.extend(entries)
+        for entry in entries:
+            gui_hooks.media_sync_did_progress(entry)
+        gui_hooks.media_sync_did_log_entries(entries)
 
     def _on_finished(self, future: Future) -> None:
         self._syncing = False
@@ -116,7 +142,7 @@ class MediaSyncer:
         showWarning(str(exc))
 
     def entries(self) -> List[LogEntryWithTime]:
-        return self._log
+        return list(self._log)
 
     def abort(self) -> None:
         if not self.is_syncing():
@@ -163,8 +189,13 @@ class MediaSyncDialog(QDialog):
         self.mw = mw
         self._syncer = syncer
         self._close_when_done = close_when_done
+        # consecutive entries usually share a timestamp
+        self._last_stamp = -1
+        self._last_asctime = ""
         self.form = aqt.forms.synclog.Ui_Dialog()
         self.form.setupUi(self)
+        # the oldest lines are discarded as new ones arrive
+        self.form.plainTextEdit.setMaximumBlockCount(2000)
         self.setWindowTitle(tr(TR.SYNC_MEDIA_LOG_TITLE))
         self.abort_button = QPushButton(tr(TR.SYNC_ABORT_BUTTON))
         qconnect(self.abort_button.clicked, self._on_abort)
@@ -172,11 +203,13 @@ class MediaSyncDialog(QDialog):
         self.form.buttonBox.addButton(self.abort_button, QDialogButtonBox.ActionRole)
         self.abort_button.setHidden(not self._syncer.is_syncing())
 
-        gui_hooks.media_sync_did_progress.append(self._on_log_entry)
+        gui_hooks.media_sync_did_log_entries.append(self._on_log_entries)
         gui_hooks.media_sync_did_start_or_stop.append(self._on_start_stop)
 
+        # older entries are rarely of interest, and rendering them all would
+        # slow down opening the dialog
         self.form.plainTextEdit.setPlainText(
-            "\n".join(self._entry_to_text(x) for x in syncer.entries())
+            "\n".join([self._entry_to_text(x) for x in syncer.entries()[-1000:]])
         )
         self.show()
 
@@ -198,8 +231,10 @@ class MediaSyncDialog(QDialog):
         self.abort_button.setHidden(True)
 
     def _time_and_text(self, stamp: int, text: str) -> str:
-        asctime = time.asctime(time.localtime(stamp))
-        return f"{asctime}: {text}"
+        if stamp != self._last_stamp:
+            self._last_asctime = time.asctime(time.localtime(stamp))
+            self._last_stamp = stamp
+        return f"{self._last_asctime}: {text}"
 
     def _entry_to_text(self, entry: LogEntryWithTime):
         if isinstance(entry.entry, str):
@@ -213,8 +248,11 @@ class MediaSyncDialog(QDialog):
     def _logentry_to_text(self, e: MediaSyncProgress) -> str:
         return f"{e.added}, {e.removed}, {e.checked}"
 
-    def _on_log_entry(self, entry: LogEntryWithTime):
-        self.form.plainTextEdit.appendPlainText(self._entry_to_text(entry))
+    def _on_log_entries(self, entries: List[LogEntryWithTime]):
+        # a single append means a single relayout for the whole batch
+        self.form.plainTextEdit.appendPlainText(
+            "\n".join([self._entry_to_text(x) for x in entries])
+        )
         if not self._syncer.is_syncing():
             self.abort_button.setHidden(True)
 
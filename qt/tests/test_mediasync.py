@@ -0,0 +1,31 @@
+import time
+
+from mock import MagicMock
+
+from aqt.mediasync import LogEntryWithTime, MediaSyncDialog
+
+
+def mock_dialog() -> MagicMock:
+    diag = MagicMock()
+    diag._last_stamp = -1
+    diag._last_asctime = ""
+    for name in "_time_and_text", "_entry_to_text", "_logentry_to_text":
+        setattr(diag, name, getattr(MediaSyncDialog, name).__get__(diag))
+    return diag
+
+
+def test_log_entries_appended_together():
+    diag = mock_dialog()
+    entries = [
+        LogEntryWithTime(time=1000, entry="one"),
+        LogEntryWithTime(time=1000, entry="two"),
+        LogEntryWithTime(time=1000, entry="three"),
+        LogEntryWithTime(time=1001, entry="four"),
+    ]
+    MediaSyncDialog._on_log_entries(diag, entries)
+
+    first = time.asctime(time.localtime(1000))
+    second = time.asctime(time.localtime(1001))
+    diag.form.plainTextEdit.appendPlainText.assert_called_once_with(
+        f"{first}: one\n{first}: two\n{first}: three\n{second}: four"
+    )
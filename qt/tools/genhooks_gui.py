@@ -435,6 +435,12 @@ hooks = [
     Hook(
         name="media_sync_did_progress", args=["entry: aqt.mediasync.LogEntryWithTime"],
     ),
+    Hook(
+        name="media_sync_did_log_entries",
+        args=["entries: List[aqt.mediasync.LogEntryWithTime]"],
+        doc="""Called once with each batch of new log entries, after
+        media_sync_did_progress has been called for each of them.""",
+    ),
     Hook(name="media_sync_did_start_or_stop", args=["running: bool"]),
     Hook(
         name="empty_cards_will_show",
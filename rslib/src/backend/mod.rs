@@ -569,6 +569,16 @@ impl BackendService for Backend {
         })
     }
 
+    fn get_cards_for_note(&mut self, input: pb::NoteId) -> BackendResult<pb::GetCardsForNoteOut> {
+        self.with_col(|col| {
+            col.storage
+                .all_cards_of_note(input.into())
+                .map(|cards| pb::GetCardsForNoteOut {
+                    cards: cards.into_iter().map(card_to_pb).collect(),
+                })
+        })
+    }
+
     fn update_card(&mut self, input: pb::Card) -> BackendResult<Empty> {
         let mut card = pbcard_to_native(input)?;
         self.with_col(|col| {
@@ -669,6 +679,19 @@ impl BackendService for Backend {
         })
     }
 
+    fn get_notes(&mut self, input: pb::GetNotesIn) -> BackendResult<pb::GetNotesOut> {
+        self.with_col(|col| {
+            let mut notes = Vec::with_capacity(input.nids.len());
+            for nid in input.nids {
+                // notes deleted since the ids were obtained are skipped
+                if let Some(note) = col.storage.get_note(NoteID(nid))? {
+                    notes.push(note.into());
+                }
+            }
+            Ok(pb::GetNotesOut { notes })
+        })
+    }
+
     fn after_note_updates(&mut self, input: pb::AfterNoteUpdatesIn) -> BackendResult<Empty> {
         self.with_col(|col| {
             col.transact(None, |col| {
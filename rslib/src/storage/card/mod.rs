@@ -185,6 +185,17 @@ impl super::SqliteStorage {
             .map_err(Into::into)
     }
 
+    pub(crate) fn all_cards_of_note(&self, nid: NoteID) -> Result<Vec<Card>> {
+        self.db
+            .prepare_cached(concat!(
+                include_str!("get_card.sql"),
+                " where nid = ? order by ord"
+            ))?
+            .query_map(params![nid], row_to_card)?
+            .collect::<result::Result<_, _>>()
+            .map_err(Into::into)
+    }
+
     pub(crate) fn clear_pending_card_usns(&self) -> Result<()> {
         self.db
             .prepare("update cards set usn = 0 where usn = -1")?
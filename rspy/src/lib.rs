@@ -63,6 +63,7 @@ fn want_release_gil(method: u32) -> bool {
             BackendMethod::NewDeckConfigLegacy => false,
             BackendMethod::RemoveDeckConfig => true,
             BackendMethod::GetCard => true,
+            BackendMethod::GetCardsForNote => true,
             BackendMethod::UpdateCard => true,
             BackendMethod::AddCard => true,
             BackendMethod::NewNote => true,
@@ -74,6 +75,7 @@ fn want_release_gil(method: u32) -> bool {
             BackendMethod::ClozeNumbersInNote => true,
             BackendMethod::AfterNoteUpdates => true,
             BackendMethod::FieldNamesForNotes => true,
+            BackendMethod::GetNotes => true,
             BackendMethod::AddOrUpdateNotetype => true,
             BackendMethod::GetStockNotetypeLegacy => false,
             BackendMethod::GetNotetypeLegacy => true,